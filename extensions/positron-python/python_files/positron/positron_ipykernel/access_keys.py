@@ -11,8 +11,9 @@ from .utils import JsonData
 
 
 def encode_access_key(key: Any) -> str:
-    # If it's not hashable, raise an error.
-    if not isinstance(key, Hashable):
+    # If it's not hashable, raise an error. Most keys are variable names, so skip the slower
+    # Hashable ABC check for strings.
+    if not isinstance(key, str) and not isinstance(key, Hashable):
         raise TypeError(f"Key {key} is not hashable.")
 
     # If it's a blank string, return it as-is.
@@ -13,6 +13,7 @@ import pydoc
 import re
 import sys
 import types
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import (
     Mapping,
@@ -22,6 +23,7 @@ from collections.abc import (
     Sequence,
     Set,
 )
+from functools import cached_property
 from inspect import getattr_static
 from typing import (
     TYPE_CHECKING,
@@ -215,6 +217,9 @@ class PositronInspector(Generic[T]):
 
 
 class NoneInspector(PositronInspector[type(None)]):
+    def get_length(self) -> int:
+        return 0
+
     def is_mutable(self) -> bool:
         return False
 
@@ -226,6 +231,9 @@ class BooleanInspector(PositronInspector[bool]):
     def get_kind(self) -> str:
         return "boolean"
 
+    def get_length(self) -> int:
+        return 0
+
     def value_to_json(self) -> JsonData:
         return self.value
 
@@ -259,6 +267,9 @@ class BytesInspector(PositronInspector[bytes]):
     def get_kind(self) -> str:
         return "bytes"
 
+    def get_length(self) -> int:
+        return len(self.value)
+
     def has_children(self) -> bool:
         return False
 
@@ -337,7 +348,7 @@ class FunctionInspector(PositronInspector[Callable]):
         truncate_at: int = TRUNCATE_AT,
     ) -> Tuple[str, bool]:
         if callable(self.value):
-            sig = inspect.signature(self.value)
+            sig = _get_signature(self.value)
         else:
             sig = "()"
         return (f"{self.value.__qualname__}{sig}", False)
@@ -346,6 +357,41 @@ class FunctionInspector(PositronInspector[Callable]):
         return "function"
 
 
+# Formatted signatures of functions, keyed by the function. inspect.signature is relatively
+# expensive and functions are re-summarized on every list and refresh. Weakly keyed so that the
+# cache doesn't keep functions alive. Cleared before each execution, see clear_signature_cache.
+_SIGNATURE_CACHE: weakref.WeakKeyDictionary[Callable, str] = weakref.WeakKeyDictionary()
+
+
+def clear_signature_cache() -> None:
+    """
+    Clear cached function signatures, which go stale if the function is modified in place (e.g.
+    by assigning `__defaults__`, `__signature__`, or `__wrapped__`).
+    """
+    _SIGNATURE_CACHE.clear()
+
+
+def _get_signature(value: Callable) -> str:
+    try:
+        return _SIGNATURE_CACHE[value]
+    except (KeyError, TypeError):
+        # TypeError: the callable doesn't support weak references
+        pass
+
+    try:
+        sig = str(inspect.signature(value))
+    except (TypeError, ValueError):
+        # Some callables, e.g. those with an invalid __signature__, have no signature
+        sig = "(...)"
+
+    try:
+        _SIGNATURE_CACHE[value] = sig
+    except TypeError:
+        pass
+
+    return sig
+
+
 class NumberInspector(PositronInspector[numbers.Number]):
     def is_mutable(self) -> bool:
         return False
@@ -353,26 +399,30 @@ class NumberInspector(PositronInspector[numbers.Number]):
     def get_kind(self) -> str:
         return "number"
 
+    def get_length(self) -> int:
+        return 0
+
     def type_to_json(self) -> str:
         # Note that our serialization of numbers is lossy, since for example `numpy.int8(0)` would
         # be serialized as `int`. This is fine for our purposes, since `numpy.int8(0)` and `int(0)`
         # can be used interchangeably as keys in a dictionary.
-        if isinstance(self.value, numbers.Integral):
+        # Builtin types are checked first since the numbers ABC checks are much slower.
+        if isinstance(self.value, (int, numbers.Integral)):
             return "int"
-        if isinstance(self.value, numbers.Real):
+        if isinstance(self.value, (float, numbers.Real)):
             return "float"
-        if isinstance(self.value, numbers.Complex):
+        if isinstance(self.value, (complex, numbers.Complex)):
             return "complex"
         raise NotImplementedError(
             f"type_to_json() is not implemented for this type. type: {type(self.value)}"
         )
 
     def value_to_json(self) -> JsonData:
-        if isinstance(self.value, numbers.Integral):
+        if isinstance(self.value, (int, numbers.Integral)):
             return int(self.value)
-        if isinstance(self.value, numbers.Real):
+        if isinstance(self.value, (float, numbers.Real)):
             return float(self.value)
-        if isinstance(self.value, numbers.Complex):
+        if isinstance(self.value, (complex, numbers.Complex)):
             return str(self.value)
         return super().value_to_json()
 
@@ -418,6 +468,9 @@ class StringInspector(PositronInspector[str]):
     def get_kind(self) -> str:
         return "string"
 
+    def get_length(self) -> int:
+        return len(self.value)
+
     def has_children(self) -> bool:
         return False
 
@@ -882,9 +935,15 @@ class BaseTableInspector(_BaseMapInspector[Table], Generic[Table, Column], ABC):
     Base inspector for tabular data
     """
 
+    @cached_property
+    def _shape(self) -> Tuple[int, int]:
+        # Summarizing a table needs its shape several times, and computing it isn't free
+        # (e.g. pandas derives it from the index and columns on every access)
+        return self.value.shape
+
     def get_display_type(self) -> str:
         type_name = type(self.value).__name__
-        shape = self.value.shape
+        shape = self._shape
         return f"{type_name} [{shape[0]}x{shape[1]}]"
 
     def get_kind(self) -> str:
@@ -893,7 +952,12 @@ class BaseTableInspector(_BaseMapInspector[Table], Generic[Table, Column], ABC):
     def get_length(self) -> int:
         # send number of columns.
         # number of rows per column is handled by ColumnInspector
-        return self.value.shape[1]
+        return self._shape[1]
+
+    def get_size(self) -> int:
+        # Same estimate as _BaseMapInspector.get_size
+        rows, columns = self._shape
+        return rows * columns * 8
 
     def has_viewer(self) -> bool:
         return True
@@ -907,9 +971,8 @@ class BaseTableInspector(_BaseMapInspector[Table], Generic[Table, Column], ABC):
         truncate_at: int = TRUNCATE_AT,
     ) -> Tuple[str, bool]:
         display_value = _get_class_display(self.value)
-        if hasattr(self.value, "shape"):
-            shape = self.value.shape
-            display_value = f"[{shape[0]} rows x {shape[1]} columns] {display_value}"
+        shape = self._shape
+        display_value = f"[{shape[0]} rows x {shape[1]} columns] {display_value}"
 
         return (display_value, True)
 
@@ -926,7 +989,7 @@ class PandasDataFrameInspector(BaseTableInspector["pd.DataFrame", "pd.Series"]):
         return str(self.value.columns[key])
 
     def get_children(self):
-        return range(self.value.shape[1])
+        return range(self._shape[1])
 
     def get_child(self, key: int) -> Any:
         return self.value.iloc[:, key]
@@ -961,7 +1024,7 @@ class PolarsDataFrameInspector(BaseTableInspector["pl.DataFrame", "pl.Series"]):
         truncate_at: int = TRUNCATE_AT,
     ) -> Tuple[str, bool]:
         qualname = _get_class_display(self.value)
-        shape = self.value.shape
+        shape = self._shape
         display_value = f"[{shape[0]} rows x {shape[1]} columns] {qualname}"
         return (display_value, True)
 
@@ -1056,7 +1119,40 @@ INSPECTOR_CLASSES: Dict[str, Type[PositronInspector]] = {
 #
 
 
+# Inspector classes keyed by value type. Only populated for values whose qualified name is
+# derived from their type and whose __class__ is their type (unlike e.g. proxies of different
+# kinds of objects), so that a cache hit always resolves to the same inspector as a full lookup.
+# Weakly keyed so that classes redefined by the user can still be garbage collected.
+_INSPECTOR_CLASS_CACHE: weakref.WeakKeyDictionary[type, Type[PositronInspector]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def get_inspector(value: T) -> PositronInspector[T]:
+    value_type = type(value)
+    inspector_cls = _INSPECTOR_CLASS_CACHE.get(value_type)
+
+    if inspector_cls is None:
+        inspector_cls = _get_inspector_class(value)
+        if getattr(value, "__class__", None) is value_type and not _is_named_by_value(value):
+            _INSPECTOR_CLASS_CACHE[value_type] = inspector_cls
+
+    return inspector_cls(value)
+
+
+def _is_named_by_value(value: Any) -> bool:
+    """
+    Whether the value's qualified name is derived from the value itself rather than its type.
+    Mirrors the checks in `get_qualname`.
+    """
+    return (
+        isinstance(value, (type, property, types.ModuleType))
+        or callable(value)
+        or inspect.isgetsetdescriptor(value)
+    )
+
+
+def _get_inspector_class(value: Any) -> Type[PositronInspector]:
     # Look for a specific inspector by qualified classname
     if isinstance(value, type):
         qualname = "type"
@@ -1075,29 +1171,71 @@ def get_inspector(value: T) -> PositronInspector[T]:
     if inspector_cls is None:
         inspector_cls = PositronInspector
 
-    inspector = inspector_cls(value)
+    return inspector_cls
+
+
+# Kinds of common builtin types, looked up by exact type to avoid the isinstance chain below
+# (which goes through the slower ABC machinery for e.g. Mapping and Sequence).
+_KIND_BY_TYPE: Dict[type, str] = {
+    str: "string",
+    bool: "boolean",
+    int: "number",
+    float: "number",
+    complex: "number",
+    dict: "map",
+    bytes: "bytes",
+    bytearray: "bytes",
+    memoryview: "bytes",
+    list: "collection",
+    tuple: "collection",
+    set: "collection",
+    frozenset: "collection",
+    range: "collection",
+    types.FunctionType: "function",
+    types.MethodType: "function",
+    type: "class",
+    type(None): "empty",
+}
+
 
-    return inspector
+# Kinds of all other classes seen so far, see _get_kind_for_class. Weakly keyed for the same
+# reason as _INSPECTOR_CLASS_CACHE.
+_KIND_CACHE: weakref.WeakKeyDictionary[type, str] = weakref.WeakKeyDictionary()
 
 
 def _get_kind(value: Any) -> str:
-    if isinstance(value, str):
+    kind = _KIND_BY_TYPE.get(type(value))
+    if kind is None:
+        # Key on __class__ rather than type(), since that's what isinstance follows. They differ
+        # for proxies (e.g. weakref.proxy) and mocks, which should be treated like the object
+        # they stand in for.
+        value_class = getattr(value, "__class__", type(value))
+        kind = _KIND_CACHE.get(value_class)
+        if kind is None:
+            kind = _KIND_CACHE[value_class] = _get_kind_for_class(value_class)
+    return kind
+
+
+def _get_kind_for_class(value_class: type) -> str:
+    # Fall back to subclass checks for subclasses and other registered types. These go through
+    # the ABC machinery but only depend on the value's class, so the result is cached in _get_kind.
+    if issubclass(value_class, str):
         return "string"
-    elif isinstance(value, bool):
+    elif issubclass(value_class, bool):
         return "boolean"
-    elif isinstance(value, numbers.Number):
+    elif issubclass(value_class, (int, float, complex, numbers.Number)):
         return "number"
-    elif isinstance(value, Mapping):
+    elif issubclass(value_class, Mapping):
         return "map"
-    elif isinstance(value, (bytes, bytearray, memoryview)):
+    elif issubclass(value_class, (bytes, bytearray, memoryview)):
         return "bytes"
-    elif isinstance(value, (Sequence, Set)):
+    elif issubclass(value_class, (Sequence, Set)):
         return "collection"
-    elif isinstance(value, (types.FunctionType, types.MethodType)):
+    elif issubclass(value_class, (types.FunctionType, types.MethodType)):
         return "function"
-    elif isinstance(value, type):
+    elif issubclass(value_class, type):
         return "class"
-    elif value is not None:
+    elif value_class is not type(None):
         return "other"
     else:
         return "empty"
@@ -9,7 +9,9 @@ import pprint
 import random
 import string
 import types
+import weakref
 from typing import Any, Callable, Iterable, Optional, Tuple
+from unittest.mock import Mock
 
 import numpy as np
 import pandas as pd
@@ -18,8 +20,14 @@ import pytest
 from fastcore.foundation import L
 
 from positron_ipykernel.inspectors import (
+    _INSPECTOR_CLASS_CACHE,
     PRINT_WIDTH,
     TRUNCATE_AT,
+    ClassInspector,
+    CollectionInspector,
+    FunctionInspector,
+    MapInspector,
+    ObjectInspector,
     get_inspector,
 )
 from positron_ipykernel.utils import get_qualname
@@ -574,6 +582,16 @@ def test_inspect_function(value: Callable) -> None:
     )
 
 
+def test_inspect_function_without_signature() -> None:
+    def fn():
+        pass
+
+    fn.__signature__ = "invalid"  # type: ignore
+
+    display_value, _ = get_inspector(fn).get_display_value()
+    assert display_value == f"{fn.__qualname__}(...)"
+
+
 #
 # Test objects
 #
@@ -868,3 +886,65 @@ def test_arrays_maps_get_size(value: Any, expected: int) -> None:
         return
     inspector = get_inspector(value)
     assert inspector.get_size() == expected
+
+
+def test_get_inspector_cache() -> None:
+    def foo():
+        pass
+
+    class Bar:
+        pass
+
+    # Functions and classes are named by the value itself, so their inspector class isn't cached
+    assert isinstance(get_inspector(foo), FunctionInspector)
+    assert types.FunctionType not in _INSPECTOR_CLASS_CACHE
+    assert isinstance(get_inspector(Bar), ClassInspector)
+    assert type not in _INSPECTOR_CLASS_CACHE
+
+    # Other values are cached by type
+    assert isinstance(get_inspector(Bar()), ObjectInspector)
+    assert _INSPECTOR_CLASS_CACHE[Bar] is ObjectInspector
+    assert isinstance(get_inspector(Bar()), ObjectInspector)
+
+
+def test_get_inspector_cache_proxies() -> None:
+    class MyList(list):
+        pass
+
+    class MyDict(dict):
+        pass
+
+    my_list = MyList([1, 2])
+    my_dict = MyDict(a=1)
+
+    # Proxies share a type but dispatch on the proxied object's class, so aren't cached
+    assert isinstance(get_inspector(weakref.proxy(my_list)), CollectionInspector)
+    assert isinstance(get_inspector(weakref.proxy(my_dict)), MapInspector)
+    assert weakref.ProxyType not in _INSPECTOR_CLASS_CACHE
+
+
+def test_get_display_value_long_repr_once() -> None:
+    class Foo:
+        repr_calls = 0
+
+        def __repr__(self) -> str:
+            Foo.repr_calls += 1
+            return "x" * (PRINT_WIDTH + 1)
+
+    display_value, _ = get_inspector(Foo()).get_display_value()
+
+    assert display_value == "x" * (PRINT_WIDTH + 1)
+    assert Foo.repr_calls == 1
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        (list, "collection"),
+        (dict, "map"),
+        (str, "string"),
+    ],
+)
+def test_get_kind_follows_class(spec: type, expected: str) -> None:
+    # Objects whose __class__ differs from their type are treated like the class they report
+    assert get_inspector(Mock(spec=spec)).get_kind() == expected
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import asyncio
+import weakref
 from typing import Any, Dict, List, cast
 from unittest.mock import ANY, Mock, patch
 
@@ -183,6 +184,52 @@ def test_change_detection_over_limit(shell: PositronShell, variables_comm: Dummy
     _assert_assigned(shell, big_array, variables_comm)
 
 
+def test_no_update_without_changes(shell: PositronShell, variables_comm: DummyComm):
+    shell.run_cell("x = 1")
+    variables_comm.messages.clear()
+
+    # Reading the namespace without modifying it should not send an update.
+    shell.run_cell("print(x)")
+
+    assert variables_comm.messages == []
+
+
+def test_snapshot_released_after_execution(
+    shell: PositronShell, variables_service: VariablesService, variables_comm: DummyComm
+):
+    shell.run_cell("def f(): pass")
+    ref = weakref.ref(shell.user_ns["f"])
+
+    shell.run_cell("del f")
+
+    # The pre-execution snapshot should not keep the deleted value alive
+    assert variables_service._snapshot is None
+    assert ref() is None
+
+
+def test_nested_execution(shell: PositronShell, variables_comm: DummyComm):
+    # Changes made by the outer cell after a nested execution should still be detected
+    shell.run_cell("get_ipython().run_cell('a = 1')\nb = 2")
+
+    assigned = {
+        variable["display_name"]
+        for msg in variables_comm.messages
+        for variable in msg["data"]["params"]["assigned"]
+    }
+    assert assigned == {"a", "b"}
+
+
+def test_function_modified_in_place(shell: PositronShell, variables_comm: DummyComm):
+    shell.run_cell("def f(a=1): pass")
+    variables_comm.messages.clear()
+    assert _do_list(variables_comm)["variables"][0].display_value == "f(a=1)"
+
+    # Cached signatures shouldn't outlive an in-place modification of the function
+    shell.run_cell("f.__defaults__ = (2,)")
+    variables_comm.messages.clear()
+    assert _do_list(variables_comm)["variables"][0].display_value == "f(a=2)"
+
+
 def _do_list(variables_comm: DummyComm):
     msg = json_rpc_request("list", comm_id="dummy_comm_id")
     with patch("positron_ipykernel.variables.timestamp", return_value=0):
@@ -207,6 +254,32 @@ def _do_list(variables_comm: DummyComm):
     return result
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        1,
+        np.int64(1),
+        1.5,
+        "x",
+        b"x",
+        [1, 2],
+        {"a": 1},
+        np.array([1, 2]),
+        pd.Series([1, 2]),
+        pd.DataFrame({"a": [1, 2]}),
+        pl.Series([1, 2]),
+        pl.DataFrame({"a": [1, 2]}),
+        json_rpc_request,
+    ],
+)
+def test_summarize_variable_valid(value: Any) -> None:
+    # Summaries are constructed without validation, so check that they would pass it.
+    summary = not_none(_summarize_variable("x", value))
+    assert Variable.parse_obj(summary.dict()) == summary
+
+
 def test_list_1000(shell: PositronShell, variables_comm: DummyComm) -> None:
     # Create 1000 variables
     for j in range(0, 1000, 1):
@@ -275,6 +348,31 @@ def test_update_max_items_plus_one(
     assert variables[variables_len - 1].get("display_value") == str(variables_len - 1 + add_value)
 
 
+def test_remove_max_items_plus_one(
+    shell: PositronShell, variables_comm: DummyComm, monkeypatch
+) -> None:
+    # Monkeypatch MAX_ITEMS to avoid a slow test; we're still testing the logic
+    max_items = 10
+    monkeypatch.setattr(variables_module, "MAX_ITEMS", max_items)
+
+    # Create and remove more than MAX_ITEMS variables
+    n = max_items + 1
+    shell.run_cell("\n".join(f"x{j} = {j}" for j in range(n)))
+    variables_comm.messages.clear()
+    shell.run_cell("del " + ", ".join(f"x{j}" for j in range(n)))
+
+    # Removals aren't summarized, so the kernel splits them across multiple update messages
+    assert [msg.get("data").get("method") for msg in variables_comm.messages] == [
+        "update",
+        "update",
+    ]
+
+    # Check we did not exceed MAX_ITEMS variables per message, nor lose any variables
+    first, second = [msg.get("data").get("params") for msg in variables_comm.messages]
+    assert len(first.get("removed")) == max_items
+    assert len(second.get("removed")) == 1
+
+
 def create_and_update_n_vars(
     n: int, add_value: int, shell: PositronShell, variables_comm: DummyComm
 ) -> Any:
@@ -349,6 +447,22 @@ def test_delete(shell: PositronShell, variables_comm: DummyComm) -> None:
     ]
 
 
+def test_delete_aliased(shell: PositronShell, variables_comm: DummyComm) -> None:
+    value = [1, 2, 3]
+    shell.user_ns.update({"x": value, "y": value, "z": 5})
+
+    msg = json_rpc_request("delete", {"names": ["x"]}, comm_id="dummy_comm_id")
+    variables_comm.handle_msg(msg)
+
+    # Other names bound to the same object are also removed
+    assert "y" not in shell.user_ns
+    assert "z" in shell.user_ns
+
+    assert variables_comm.messages == [
+        json_rpc_response(_encode_path(["x", "y"])),
+    ]
+
+
 def test_delete_error(variables_comm: DummyComm) -> None:
     msg = json_rpc_request("delete", {"names": ["x"]}, comm_id="dummy_comm_id")
     variables_comm.handle_msg(msg)
@@ -4,6 +4,7 @@
 #
 
 import asyncio
+import dataclasses
 import inspect
 import numbers
 import pprint
@@ -114,15 +115,40 @@ def is_numpy_ufunc(object: Any) -> bool:
     )
 
 
+# Types that pprint formats differently from repr() even when they fit on one line (e.g. sorting
+# dict keys), or that may be too large to repr() twice.
+_PPRINT_CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
+
+# repr() implementations that pprint reformats when they don't fit within the width (e.g. str,
+# deque, defaultdict). Falls back to always using pprint if its private dispatch table moves.
+_PPRINT_DISPATCH = getattr(pprint.PrettyPrinter, "_dispatch", None)
+
+
+def _pprint_reformats(value: Any) -> bool:
+    """
+    Whether pprint may format a value that doesn't fit within the width differently from repr().
+    """
+    if _PPRINT_DISPATCH is None:
+        return True
+    return type(value).__repr__ in _PPRINT_DISPATCH or dataclasses.is_dataclass(value)
+
+
 def pretty_format(
     value,
     print_width: Optional[int] = None,
     truncate_at: Optional[int] = None,
 ) -> Tuple[str, bool]:
-    if print_width is not None:
+    if print_width is None:
+        s = str(value)
+    elif isinstance(value, _PPRINT_CONTAINER_TYPES):
         s = pprint.pformat(value, width=print_width, compact=True)
     else:
-        s = str(value)
+        # pprint is implemented in pure Python, and for other types pformat() returns repr()
+        # unchanged unless it's too long and pprint knows how to split it. Only fall back to it in
+        # that case, since pformat() calls repr() again and long reprs tend to be expensive.
+        s = repr(value)
+        if len(s) > print_width and _pprint_reformats(value):
+            s = pprint.pformat(value, width=print_width, compact=True)
 
     # TODO: Add type aware truncation
     if truncate_at is not None:
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import itertools
 import logging
 import time
 import types
@@ -22,7 +23,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 from comm.base_comm import BaseComm
 
 from .access_keys import decode_access_key, encode_access_key
-from .inspectors import get_inspector
+from .inspectors import PositronInspector, clear_signature_cache, get_inspector
 from .positron_comm import CommMessage, JsonRpcErrorCode, PositronComm
 from .utils import (
     JsonData,
@@ -58,8 +59,10 @@ logger = logging.getLogger(__name__)
 # Maximum number of children to show in an object's expanded view.
 MAX_CHILDREN: int = 100
 
-# Maximum number of items to send in an update event. If exceeded, a
-# full refresh is sent instead.
+# Maximum number of variables to summarize in a refresh or update event.
+# If an update would summarize more, a full refresh is sent instead.
+# Removed variables aren't summarized, so any beyond this are split
+# across multiple update events.
 MAX_ITEMS: int = 10000
 
 # Budget for number of "units" of work to allow for namespace change
@@ -67,6 +70,10 @@ MAX_ITEMS: int = 10000
 # Units are rough estimates of the number of bytes copied.
 MAX_SNAPSHOT_COMPARISON_BUDGET: int = 10_000_000
 
+# Inspectors describe kinds as strings; look up the corresponding enum
+# member directly rather than calling VariableKind(...) per variable.
+_VARIABLE_KINDS: Dict[str, VariableKind] = {kind.value: kind for kind in VariableKind}
+
 
 def timestamp() -> int:
     """
@@ -109,6 +116,10 @@ class VariablesService:
 
         self._snapshot: Optional[Dict[str, Any]] = None
 
+        # Number of executions in progress. Greater than one while a cell's code runs another
+        # (e.g. via `get_ipython().run_cell()`), since each fires its own pre and post hooks.
+        self._execution_depth = 0
+
     def on_comm_open(self, comm: BaseComm, msg: JsonRecord) -> None:
         """
         Setup positron.variables comm to receive messages.
@@ -198,8 +209,9 @@ class VariablesService:
             if con_service.variable_has_active_connection(name):
                 con_service.handle_variable_updated(name, value)
 
-        # Ensure the number of changes does not exceed our maximum items
-        if len(assigned) > MAX_ITEMS or len(removed) > MAX_ITEMS:
+        # Ensure the number of variables to summarize does not exceed our
+        # maximum items, since a refresh would then be no more expensive
+        if len(assigned) + len(unevaluated) > MAX_ITEMS:
             return self.send_refresh_event()
 
         # Filter out hidden assigned variables
@@ -211,16 +223,21 @@ class VariablesService:
         filtered_unevaluated = _summarize_children(variables, MAX_ITEMS)
 
         # Filter out hidden removed variables and encode access keys
-        hidden = self._get_user_ns_hidden()
-        filtered_removed = [
-            encode_access_key(name) for name in sorted(removed) if name not in hidden
-        ]
-
-        if filtered_assigned or filtered_unevaluated or filtered_removed:
+        filtered_removed = []
+        if removed:
+            hidden = self._get_user_ns_hidden()
+            filtered_removed = [encode_access_key(name) for name in sorted(removed - hidden.keys())]
+
+        # Split large changes across multiple update events of at most
+        # MAX_ITEMS each, rather than resending the entire namespace. Only
+        # removals can exceed MAX_ITEMS at this point.
+        num_changes = max(len(filtered_assigned), len(filtered_unevaluated), len(filtered_removed))
+        for start in range(0, num_changes, MAX_ITEMS):
+            end = start + MAX_ITEMS
             msg = UpdateParams(
-                assigned=filtered_assigned,
-                unevaluated=filtered_unevaluated,
-                removed=filtered_removed,
+                assigned=filtered_assigned[start:end],
+                unevaluated=filtered_unevaluated[start:end],
+                removed=filtered_removed[start:end],
                 version=0,
             )
             self._send_event(VariablesFrontendEvent.Update.value, msg.dict())
@@ -264,6 +281,8 @@ class VariablesService:
                 pass
 
     def poll_variables(self) -> None:
+        self._execution_depth = max(self._execution_depth - 1, 0)
+
         # First check pre_execute snapshot exists
         if self._snapshot is None:
             return
@@ -271,6 +290,20 @@ class VariablesService:
         try:
             # Try to detect the changes made since the last execution
             assigned, unevaluated, removed = self._compare_user_ns()
+
+            # The snapshot holds references to the pre-execution values
+            # (and copies of mutable ones), which would otherwise keep
+            # deleted or reassigned objects alive until the next execution.
+            # A nested execution's snapshot is still needed to detect the
+            # rest of the outer execution's changes.
+            if self._execution_depth == 0:
+                self._snapshot = None
+
+            # Most executions don't change the namespace (e.g. `print(x)`),
+            # so skip summarizing and sending an update in that case
+            if not assigned and not unevaluated and not removed:
+                return
+
             self._send_update(assigned, unevaluated, removed)
         except Exception as err:
             logger.warning(err, exc_info=True)
@@ -287,6 +320,11 @@ class VariablesService:
         the execution overhead to a minimum when namespaces get large
         or contain many large mutable objects.
         """
+        self._execution_depth += 1
+
+        # The code about to run may modify functions in place
+        clear_signature_cache()
+
         ns = self._get_user_ns()
         hidden = self._get_user_ns_hidden()
 
@@ -303,8 +341,9 @@ class VariablesService:
         # detection logic either because the cost is too large or
         # cannot be estimated easily (for example, any collection
         # containing arbitrary Python objects may be arbitrarily
-        # expensive to deepcopy and do comparisons on)
-        mutable_vars_excluded = {}
+        # expensive to deepcopy and do comparisons on). Their values are
+        # never compared, so only the names are tracked.
+        mutable_vars_excluded = []
 
         comparison_cost = 0
 
@@ -319,7 +358,7 @@ class VariablesService:
             if inspector.is_mutable():
                 cost = inspector.get_comparison_cost()
                 if comparison_cost + cost > MAX_SNAPSHOT_COMPARISON_BUDGET:
-                    mutable_vars_excluded[key] = value
+                    mutable_vars_excluded.append(key)
                 else:
                     comparison_cost += cost
                     try:
@@ -327,7 +366,7 @@ class VariablesService:
                     except copy.Error:
                         # when a variable is mutable, but not copiable we can't
                         # detect changes on it
-                        mutable_vars_excluded[key] = value
+                        mutable_vars_excluded.append(key)
             else:
                 immutable_vars[key] = value
 
@@ -339,8 +378,10 @@ class VariablesService:
         elapsed = time.time() - start
         logger.debug(f"Snapshotting namespace took {elapsed:.4f} seconds")
 
-        copied = repr(list(self._snapshot["mutable_copied"].keys()))
-        logger.debug(f"Variables copied: {copied}")
+        # Avoid building the list of copied names on every execution unless it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            copied = repr(list(mutable_vars_copied.keys()))
+            logger.debug(f"Variables copied: {copied}")
 
     def _compare_user_ns(
         self,
@@ -376,12 +417,9 @@ class VariablesService:
 
             return type(inspector1) is not type(inspector2) or not inspector1.equals(v2)
 
-        def _compare_always_different(v1, v2):
-            return True
-
         all_snapshot_keys = set()
 
-        def _check_ns_subset(ns_subset, evaluated, are_different_func):
+        def _check_ns_subset(ns_subset, are_different_func):
             all_snapshot_keys.update(ns_subset.keys())
 
             for key, value in ns_subset.items():
@@ -393,19 +431,28 @@ class VariablesService:
                         # Key was removed
                         removed.add(key)
                     elif are_different_func(value, after[key]):
-                        if evaluated:
-                            assigned[key] = after[key]
-                        else:
-                            unevaluated[key] = after[key]
+                        assigned[key] = after[key]
                 except Exception as err:
                     logger.warning("err: %s", err, exc_info=True)
                     raise
 
         start = time.time()
 
-        _check_ns_subset(snapshot["immutable"], True, _compare_immutable)
-        _check_ns_subset(snapshot["mutable_copied"], True, _compare_mutable)
-        _check_ns_subset(snapshot["mutable_excluded"], False, _compare_always_different)
+        _check_ns_subset(snapshot["immutable"], _compare_immutable)
+        _check_ns_subset(snapshot["mutable_copied"], _compare_mutable)
+
+        # Excluded variables are always reported as unevaluated, so we
+        # only need to look up their current values by name
+        excluded = snapshot["mutable_excluded"]
+        all_snapshot_keys.update(excluded)
+        for key in excluded:
+            if key in hidden:
+                continue
+
+            if key not in after:
+                removed.add(key)
+            else:
+                unevaluated[key] = after[key]
 
         for key, value in after.items():
             if key in hidden:
@@ -439,11 +486,15 @@ class VariablesService:
         if variables is None:
             variables = self._get_user_ns()
 
-        filtered_variables = {}
-        for key, value in variables.items():
-            if key not in hidden:
-                filtered_variables[key] = value
-        return filtered_variables
+        # Find the hidden names that are present with a C-level set intersection. Changes
+        # detected by _compare_user_ns already exclude hidden names, so this is usually empty and
+        # we can skip filtering altogether.
+        hidden_keys = variables.keys() & hidden.keys()
+        if not hidden_keys:
+            return dict(variables)
+
+        # Preserve the namespace order, which determines the order variables are displayed in
+        return {key: value for key, value in variables.items() if key not in hidden_keys}
 
     def _find_var(self, path: Iterable[str]) -> Tuple[bool, Any]:
         """
@@ -524,7 +575,12 @@ class VariablesService:
         if names is None:
             return
 
-        self.snapshot_user_ns()
+        # Deleting a variable also deletes other names bound to the same object, so remember the
+        # names of all visible variables to find what was removed. Only the names are needed --
+        # a full snapshot would copy (and hold references to) every value in the namespace.
+        ns = self._get_user_ns()
+        hidden = self._get_user_ns_hidden()
+        visible_names = [name for name in ns if name not in hidden]
 
         for name in names:
             try:
@@ -533,7 +589,7 @@ class VariablesService:
                 logger.warning(f"Unable to delete variable '{name}'")
                 pass
 
-        _, _, removed = self._compare_user_ns()
+        removed = {name for name in visible_names if name not in ns}
 
         # Publish an input to inform clients of the variables that were deleted
         if len(removed) > 0:
@@ -746,8 +802,7 @@ def _summarize_variable(
         # Use an inspector to summarize the value
         ins = get_inspector(value)
 
-        kind_str = ins.get_kind()
-        kind = VariableKind(kind_str)
+        kind = _VARIABLE_KINDS[ins.get_kind()]
         display_value, is_truncated = ins.get_display_value()
         display_type = ins.get_display_type()
         type_info = ins.get_type_info()
@@ -758,7 +813,10 @@ def _summarize_variable(
         has_viewer = ins.has_viewer()
         updated_time = timestamp()
 
-        return Variable(
+        # Skip pydantic validation, which dominates the cost of constructing a Variable; the
+        # inspectors already return values of the expected types, and this runs for every
+        # variable in every update and list.
+        return Variable.construct(
             display_name=display_name,
             display_value=display_value,
             display_type=display_type,
@@ -792,21 +850,19 @@ def _summarize_variable(
 
 def _summarize_children(parent: Any, limit: int = MAX_CHILDREN) -> List[Variable]:
     inspector = get_inspector(parent)
-    children = inspector.get_children()
-    summaries = []
-    for child in children:
-        if len(summaries) >= limit:
-            break
-        try:
-            value = inspector.get_child(child)
-        except Exception:
-            value = "Cannot get value."
-
-        display_name = inspector.get_display_name(child)
-        summary = _summarize_variable(child, value, display_name=display_name)
-        if summary is not None:
-            summaries.append(summary)
-    return summaries
+    summaries = (_summarize_child(inspector, child) for child in inspector.get_children())
+    # Lazily summarize children until the limit is reached; skipped children don't count
+    return list(itertools.islice((s for s in summaries if s is not None), limit))
+
+
+def _summarize_child(inspector: PositronInspector, child: Any) -> Optional[Variable]:
+    try:
+        value = inspector.get_child(child)
+    except Exception:
+        value = "Cannot get value."
+
+    display_name = inspector.get_display_name(child)
+    return _summarize_variable(child, value, display_name=display_name)
 
 
 def _format_value(value: Any, clipboard_format: ClipboardFormatFormat) -> str: